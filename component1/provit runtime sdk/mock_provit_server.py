@@ -1,74 +1,256 @@
+import argparse
 import http.server
-import socketserver
 import json
-from datetime import datetime
+import logging
+import logging.handlers
+import queue
+import selectors
+import socket
+import sys
+import threading
+
+try:
+    import orjson  # Faster request parsing when available
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Needed only to accept MessagePack bodies
+except ImportError:
+    msgspec = None
+
+# Parse request bodies with orjson if installed, otherwise the stdlib
+# (json.loads does not accept memoryview, so the fallback copies)
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    def _loads(data):
+        return json.loads(bytes(data))
+
+# Per-thread receive buffer, reused across requests and grown in powers of two
+_scratch = threading.local()
+
+def _recv_buffer(size: int) -> bytearray:
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(max(65536, 1 << (size - 1).bit_length()))
+        _scratch.buf = buf
+    return buf
 
 PORT = 8080
 
+logger = logging.getLogger("provit.mock_server")
+
+# Canned reply for the benchmark responder: one send() per request, no formatting
+_BENCH_REPLY = b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\nConnection: keep-alive\r\n\r\n"
+
+class _EvidenceFormatter(logging.Formatter):
+    """
+    Renders server log records. It runs on the QueueListener thread, so the
+    pretty-printed evidence dump never costs a request thread anything.
+    """
+
+    def __init__(self, show_payload: bool):
+        super().__init__("[Server] %(asctime)s %(message)s", datefmt="%H:%M:%S")
+        self.show_payload = show_payload
+
+    def format(self, record):
+        line = super().format(record)
+        event = getattr(record, "event", None)
+        if event is None or not self.show_payload:
+            return line
+        return "\n".join((
+            "=" * 50,
+            line,
+            f"[Server] Token: {record.token}",
+            "-" * 50,
+            json.dumps(event, indent=2),
+            "=" * 50 + "\n"
+        ))
+
+def _start_logging(debug: bool) -> logging.handlers.QueueListener:
+    """
+    Routes the server logger through a QueueHandler so request threads only
+    enqueue records; formatting and stdout writes happen on the listener.
+    """
+    records = queue.Queue(-1)
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(_EvidenceFormatter(show_payload=debug))
+
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(records, output)
+    listener.start()
+    return listener
+
 class ProVitMockHandler(http.server.BaseHTTPRequestHandler):
     """
-    Simulates the ProVit Platform /v1/events endpoint.
-    It receives POST requests, validates the JSON, and prints the evidence.
+    Simulates the ProVit Platform /v1/events and /v1/events:batch endpoints.
+    It receives POST requests, validates the JSON (or MessagePack), and logs
+    the evidence.
     """
+
+    # Keep connections open so the SDK can reuse one socket for many events
+    protocol_version = "HTTP/1.1"
     
     def log_message(self, format, *args):
         # Suppress default log messages to keep terminal clean
         return
 
     def do_POST(self):
-        if self.path == '/v1/events':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
+        # Always consume the body, even for unknown paths, so the next request
+        # on this keep-alive connection starts at the right offset
+        content_length = int(self.headers.get('Content-Length', 0))
+        view = memoryview(_recv_buffer(content_length))
+        post_data = view[:self.rfile.readinto(view[:content_length])]
+
+        if self.path in ('/v1/events', '/v1/events:batch'):
+            msgpack_body = self.headers.get('Content-Type') == 'application/msgpack'
+            if msgpack_body and msgspec is None:
+                logger.warning("❌ MessagePack body received but msgspec is not installed")
+                self.send_response(415)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
             try:
-                # Parse JSON payload
-                data = json.loads(post_data.decode('utf-8'))
+                # Parse JSON (or MessagePack) payload
+                data = msgspec.msgpack.decode(post_data) if msgpack_body else _loads(post_data)
+                # A single event or a batch envelope, both JSON objects
+                events = data.get("events", [data]) if isinstance(data, dict) else None
+                if not isinstance(events, list) or not all(isinstance(e, dict) for e in events):
+                    raise ValueError("body is not an event object or batch")
                 
                 # Verify Authorization Header
                 auth_header = self.headers.get('Authorization')
                 if not auth_header or not auth_header.startswith("Bearer "):
                     self.send_response(401)
+                    self.send_header('Content-Length', '0')
                     self.end_headers()
-                    print(f"\n[Server] ❌ Unauthorized Request (Missing Bearer Token)")
+                    logger.warning("❌ Unauthorized Request (Missing Bearer Token)")
                     return
 
-                # Print Received Evidence
-                print("\n" + "="*50)
-                print(f"[Server] ✅ Received AI Evidence at {datetime.now().strftime('%H:%M:%S')}")
-                print(f"[Server] Token: {auth_header}")
-                print("-" * 50)
-                print(json.dumps(data, indent=2))
-                print("="*50 + "\n")
+                # Log Received Evidence (batch bodies carry a list of events)
+                for event in events:
+                    logger.info("✅ Received AI Evidence (decision_id=%s)", event.get("decision_id"),
+                                extra={"event": event, "token": auth_header})
                 
-                # Respond with success
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
+                # Respond with success; the SDK never reads an ACK body
+                self.send_response(204)
                 self.end_headers()
-                self.wfile.write(json.dumps({"status": "received"}).encode('utf-8'))
                 
-            except json.JSONDecodeError:
-                print(f"\n[Server] ❌ Invalid JSON Received")
+            except ValueError:  # json/orjson.JSONDecodeError and msgspec.DecodeError
+                logger.warning("❌ Invalid Payload Received")
                 self.send_response(400)
+                self.send_header('Content-Length', '0')
                 self.end_headers()
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
-def run_server():
+def run_server(debug: bool = False):
     print(f"Starting Mock ProVit Server on port {PORT}...")
     print("Waiting for SDK events...")
+    listener = _start_logging(debug)
     
     # Allow address reuse to prevent "Address already in use" errors on restart
-    socketserver.TCPServer.allow_reuse_address = True
+    http.server.ThreadingHTTPServer.allow_reuse_address = True
     
-    with socketserver.TCPServer(("", PORT), ProVitMockHandler) as httpd:
+    # One thread per connection, so concurrent SDK clients are not served one at a time
+    with http.server.ThreadingHTTPServer(("", PORT), ProVitMockHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             pass
         finally:
             httpd.server_close()
+            listener.stop()
             print("\nServer stopped.")
 
+def _content_length(head: bytes) -> int:
+    """Extracts Content-Length from a raw request head (0 if absent)."""
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            return int(value)
+    return 0
+
+def _bench_read(sel, conn, buf: bytearray) -> int:
+    """
+    Reads what is available on a connection and answers every complete
+    request in the buffer. Returns the number of requests answered.
+    """
+    try:
+        chunk = conn.recv(65536)
+    except BlockingIOError:
+        return 0
+    except ConnectionError:
+        chunk = b""
+    if not chunk:
+        sel.unregister(conn)
+        conn.close()
+        return 0
+
+    buf += chunk
+    answered = 0
+    while True:
+        head_end = buf.find(b"\r\n\r\n")
+        if head_end < 0:
+            break
+        request_end = head_end + 4 + _content_length(bytes(buf[:head_end]))
+        if len(buf) < request_end:
+            break
+        del buf[:request_end]
+        answered += 1
+
+    if answered:
+        conn.sendall(_BENCH_REPLY * answered)
+    return answered
+
+def run_bench_server():
+    """
+    Throughput-testing variant of the mock: a single-threaded selectors loop
+    that skips header parsing, JSON decoding and printing, and answers each
+    request with the same precomputed 204. Use it to benchmark the SDK itself.
+    """
+    print(f"Starting Mock ProVit Benchmark Responder on port {PORT}...")
+
+    sel = selectors.DefaultSelector()
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("", PORT))
+    listener.listen(128)
+    listener.setblocking(False)
+    sel.register(listener, selectors.EVENT_READ, data=None)
+
+    served = 0
+    try:
+        while True:
+            for key, _ in sel.select():
+                if key.data is None:
+                    conn, _ = listener.accept()
+                    conn.setblocking(False)
+                    sel.register(conn, selectors.EVENT_READ, data=bytearray())
+                else:
+                    served += _bench_read(sel, key.fileobj, key.data)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sel.close()
+        listener.close()
+        print(f"\nServer stopped. Answered {served} requests.")
+
 if __name__ == "__main__":
-    run_server()
+    parser = argparse.ArgumentParser(description="Mock ProVit Platform for local SDK testing")
+    parser.add_argument("--bench", action="store_true",
+                        help="run the minimal benchmark responder instead of the evidence printer")
+    parser.add_argument("--debug", action="store_true",
+                        help="print the full JSON of every received event")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_bench_server()
+    else:
+        run_server(debug=args.debug)
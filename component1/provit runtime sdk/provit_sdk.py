@@ -1,23 +1,368 @@
+import atexit
+import base64
+import collections
+import functools
 import json
+import math
+import os
+import random
+import select
+import socket
+import ssl
 import threading
+import time
+import urllib.parse
 import urllib.request
-import urllib.error
-import uuid
 import platform
-from datetime import datetime, timezone
 from typing import Optional
 
+try:
+    import orjson  # Optional accelerator; the stdlib json module is used when absent
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional; required only for wire_format="msgpack"
+except ImportError:
+    msgspec = None
+
 # Version tracking
 __version__ = "0.1.0"
 
+# Process-wide constants attached to every event; computed once at import
+_STATIC_META = {
+    "sdk_version": __version__,
+    "language": "python",
+    "python_version": platform.python_version()
+}
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj) -> bytes:
+        """Serializes a value to JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj).encode('utf-8')
+
+# Per-thread PRNGs for event IDs (see _fast_event_id)
+_rng = threading.local()
+
+# UUID version 4 / RFC 4122 variant bits, as uuid.UUID(version=4) sets them
+_UUID4_CLEAR = ~((0xf000 << 64) | (0xc000 << 48))
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+def _fast_event_id() -> bytes:
+    """
+    Random version-4 UUID as 32 ASCII hex chars (uuid.uuid4().hex format).
+    Uses a per-thread PRNG seeded once from os.urandom, so unlike
+    uuid.uuid4() it costs no syscall per event. Event IDs need to be
+    unique, not unpredictable.
+    """
+    rng = getattr(_rng, 'r', None)
+    if rng is None:
+        rng = _rng.r = random.Random(os.urandom(16))
+    return b'%032x' % (rng.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+
+def _reset_rng():
+    global _rng
+    _rng = threading.local()
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not replay its parent's ID sequence
+    os.register_at_fork(after_in_child=_reset_rng)
+
+# time.time_ns is Python 3.7+; integer nanoseconds avoid float rounding in the fraction
+_time_ns = getattr(time, "time_ns", None) or (lambda: int(time.time() * 1_000_000_000))
+
+# (whole second, its "YYYY-MM-DDTHH:MM:SS" rendering); swapped as one tuple so
+# concurrent callers always see a matching pair
+_ts_prefix = (None, b"")
+
+def _iso_now() -> bytes:
+    """
+    Current UTC time as ISO-8601 ASCII bytes with microseconds and a 'Z' suffix.
+    The date/time part only changes once a second, so it is rendered once per
+    second and reused; each call just formats the microseconds.
+    """
+    global _ts_prefix
+    sec, ns = divmod(_time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_prefix
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)).encode('ascii')
+        _ts_prefix = (sec, prefix)
+    return b"%s.%06dZ" % (prefix, ns // 1000)
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _norm_label(label) -> str:
+    """Lowercased, stripped label text. Cached since label sets are usually small."""
+    return str(label).lower().strip()
+
+# Invariant parts of the event are rendered once; ai_runtime only fills in the
+# per-event fields (canonical layout: see ai-runtime-v0-doc.txt, 7.1)
+_EVENT_TEMPLATE = (
+    b'{"event_id":"%s","event_type":"ai.runtime","decision_id":%s,"timestamp":"%s",'
+    b'"meta":' + json.dumps(_STATIC_META, separators=(',', ':')).encode('utf-8') + b','
+    b'"payload":{"model":{"name":%s,"version":%s},'
+    b'"recommendation":{"label":%s,"confidence_score":%s}}}'
+)
+
+if msgspec is not None:
+    # MessagePack event schema. The structs are encoded C-side straight from
+    # their attributes, in the same field order as the JSON layout. They are
+    # short-lived and never part of a reference cycle, so gc=False keeps the
+    # four allocations per event out of the cyclic garbage collector.
+    _msgpack_encode = msgspec.msgpack.Encoder().encode
+
+    class _Model(msgspec.Struct, gc=False):
+        name: str
+        version: str
+
+    class _Recommendation(msgspec.Struct, gc=False):
+        label: str
+        confidence_score: Optional[float]
+
+    class _Payload(msgspec.Struct, gc=False):
+        model: _Model
+        recommendation: _Recommendation
+
+    class _RuntimeEvent(msgspec.Struct, kw_only=True, gc=False):
+        event_id: str
+        event_type: str = "ai.runtime"
+        decision_id: str
+        timestamp: str
+        meta: msgspec.Raw = msgspec.Raw(_msgpack_encode(_STATIC_META))
+        payload: _Payload
+
+# Upper bound (seconds) the interpreter waits at exit for buffered events to flush
+_SHUTDOWN_TIMEOUT = 5.0
+
+# Cap on events waiting to be sent; when full, the oldest are dropped so an
+# outage can never grow the host process's memory without bound
+_MAX_BUFFERED_EVENTS = 10_000
+
+# Events are coalesced into POSTs of up to this many; the worker lingers briefly
+# so bursts share a POST, but stops lingering as soon as a batch is full
+_BATCH_SIZE = 256
+_BATCH_LINGER = 0.05
+
+# A connection idle for longer than this (seconds) is polled for a server-side
+# close before reuse; one used more recently skips the extra syscall
+_IDLE_CHECK_AFTER = 1.0
+
+def _json_batch_chunks(batch: list):
+    """Yields the pieces of a JSON batch body in order."""
+    yield b'{"events":['
+    for i, event_data in enumerate(batch):
+        if i:
+            yield b','
+        yield event_data
+    yield b']}'
+
+def _msgpack_batch_chunks(batch: list):
+    """
+    Yields the pieces of a MessagePack batch body in order: a one-entry map
+    whose "events" array holds the already-encoded events verbatim.
+    """
+    n = len(batch)
+    yield b'\x81\xa6events'
+    if n < 16:
+        yield bytes((0x90 | n,))
+    elif n < 0x10000:
+        yield b'\xdc' + n.to_bytes(2, 'big')
+    else:
+        yield b'\xdd' + n.to_bytes(4, 'big')
+    yield from batch
+
+def _proxy_for(scheme: str, hostname: str):
+    """
+    The proxy urllib.request would use for a URL (HTTP(S)_PROXY / NO_PROXY or
+    the platform settings), as ((host, port), Proxy-Authorization value or ""),
+    or None to connect directly.
+    """
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(hostname):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = "http://" + proxy_url
+    proxy = urllib.parse.urlsplit(proxy_url)
+    auth = ""
+    if proxy.username is not None:
+        credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        auth = "Basic " + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+    return (proxy.hostname, proxy.port or 80), auth
+
+class _Connection:
+    """
+    Keep-alive HTTP/1.1 connection to one platform host, optionally through
+    a proxy (https is tunnelled with CONNECT). Only ever used by the worker
+    thread.
+    """
+
+    def __init__(self, address: tuple, tls: bool, proxy: Optional[tuple] = None):
+        self.address = address
+        self.tls = tls
+        self.proxy = proxy  # ((host, port), Proxy-Authorization value) or None
+        self._ssl_context = None
+        self._sock = None
+        self._rfile = None
+        self._last_used = 0.0  # time.monotonic() of the last complete response
+
+    def request(self, request):
+        """
+        Writes one framed HTTP request (any bytes-like object) and returns
+        (status, reason) of the response. Reconnects lazily; on any error the
+        connection is closed and the exception propagates.
+
+        A kept-alive socket the server has since closed is only discovered on
+        reuse, so a request that fails that way is retried once on a fresh
+        connection. Sockets that sat idle are checked before they are written
+        to; a busy connection costs just the send and the receive.
+        """
+        if (self._sock is not None and time.monotonic() - self._last_used > _IDLE_CHECK_AFTER
+                and self._is_dropped()):
+            self.close()
+        reused = self._sock is not None
+        try:
+            if not reused:
+                self._connect()
+            self._sock.sendall(request)
+            response = self._read_response()
+            self._last_used = time.monotonic()
+            return response
+        except (ConnectionError, ssl.SSLEOFError):
+            self.close()
+            if not reused:
+                raise
+        except Exception:
+            # Socket state is unknown after a network error; reconnect next time
+            self.close()
+            raise
+        return self.request(request)
+
+    def _is_dropped(self):
+        """
+        True if the idle socket is readable, i.e. the server closed it (or sent
+        something unsolicited) since the last response.
+        """
+        try:
+            return bool(select.select([self._sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _connect(self):
+        """Opens the connection (TLS for https endpoints)."""
+        # Strict 2-second timeout as per specification
+        sock = socket.create_connection(self.address if self.proxy is None else self.proxy[0], timeout=2)
+        try:
+            # Requests are written whole, so Nagle only delays them; keepalive
+            # probes let the OS notice a silently dead peer on an idle connection
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if self.tls:
+                if self.proxy is not None:
+                    self._tunnel(sock)
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                sock = self._ssl_context.wrap_socket(sock, server_hostname=self.address[0])
+        except Exception:
+            sock.close()
+            raise
+        self._sock = sock
+        self._rfile = sock.makefile('rb')
+
+    def _tunnel(self, sock):
+        """Asks the proxy to open a raw tunnel to the platform host over sock."""
+        host, port = self.address
+        authority = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        head = f"CONNECT {authority} HTTP/1.1\r\nHost: {authority}\r\n"
+        if self.proxy[1]:
+            head += f"Proxy-Authorization: {self.proxy[1]}\r\n"
+        sock.sendall((head + "\r\n").encode('latin-1'))
+
+        # The platform host speaks only after the TLS hello, so nothing past the
+        # proxy's reply headers can be left behind in this reader's buffer
+        with sock.makefile('rb') as rfile:
+            status_line = rfile.readline(65537)
+            while rfile.readline(65537) not in (b"\r\n", b"\n", b""):
+                pass
+        parts = status_line.split(None, 2)
+        if len(parts) < 2 or parts[1] != b"200":
+            raise ConnectionError(f"Proxy CONNECT failed: {status_line.strip().decode('latin-1') or 'no response'}")
+
+    def _read_response(self):
+        """
+        Reads one response off the connection and returns (status, reason).
+        Any body is discarded. The connection is dropped whenever it cannot
+        safely carry another request.
+        """
+        rfile = self._rfile
+        status_line = rfile.readline(65537)
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        version, status, reason = (status_line.split(None, 2) + [b""])[:3]
+        status = int(status)
+
+        content_length = None
+        connection = b""
+        while True:
+            line = rfile.readline(65537)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                content_length = int(value)
+            elif name == b"connection":
+                connection = value.strip().lower()
+
+        if status in (204, 304) or status < 200:
+            content_length = 0
+        will_close = connection == b"close" or (version == b"HTTP/1.0" and connection != b"keep-alive")
+        if content_length is None:
+            # Chunked or read-until-close body; not worth parsing, just reconnect
+            will_close = True
+        elif content_length:
+            rfile.read(content_length)
+
+        if will_close:
+            self.close()
+        return status, reason.strip().decode('latin-1')
+
+    def close(self):
+        """Drops the socket, if any."""
+        for stream in (self._rfile, self._sock):
+            if stream is not None:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+        self._sock = None
+        self._rfile = None
+
 class ProVitClient:
     """
     ProVit AI Runtime SDK (v0)
     
     A lightweight, thread-safe, fire-and-forget SDK for capturing AI evidence.
     """
+
+    # Delivery state shared by every client in the process: one buffer, one
+    # worker thread and one keep-alive connection per platform host, however
+    # many clients are created. Buffered items are (client, payload) pairs.
+    _shared_buf = None
+    _shared_wake = None
+    _shared_full = None  # Set once a full batch is buffered, to cut the linger short
+    _shared_worker = None
+    _sending = False  # True while the worker holds events taken off the buffer
+    _drained = threading.Condition()  # Notified whenever the worker finishes a batch
+    _connections = {}  # (address, tls, proxy) -> _Connection, worker-owned
+    # Worker-owned buffer that requests are assembled in. The body is
+    # written after a reserved gap so the head can be placed right before it.
+    _scratch = bytearray(4096)
+    _lock = threading.Lock()
+    _exit_hooked = False
     
-    def __init__(self, api_key: str, api_url: str = "https://api.provit.ai", debug: bool = False, normalize_labels: bool = True):
+    def __init__(self, api_key: str, api_url: str = "https://api.provit.ai", debug: bool = False, normalize_labels: bool = True,
+                 wire_format: str = "json"):
         """
         Initialize the ProVit SDK Client.
         
@@ -26,12 +371,126 @@ class ProVitClient:
             api_url (str): The base URL of the ProVit platform.
             debug (bool): If True, prints errors to stderr. Default False.
             normalize_labels (bool): If True, converts all labels to lowercase. Default True.
+            wire_format (str): "json" (default) or "msgpack". MessagePack needs the
+                optional msgspec package; without it (or for any other value) the
+                client falls back to JSON.
         """
         self.api_key = api_key
         self.api_url = api_url.rstrip('/')
         self.endpoint = f"{self.api_url}/v1/events"
         self.debug = debug
         self.normalize_labels = normalize_labels
+        # The label policy is fixed per client, so pick the converter once
+        # instead of branching on every event
+        self._label_text = _norm_label if normalize_labels else str
+        if wire_format not in ("json", "msgpack"):
+            if debug:
+                print(f"[SDK Config Warning] Unsupported wire_format {wire_format!r}; sending JSON")
+            wire_format = "json"
+        elif wire_format == "msgpack" and msgspec is None:
+            if debug:
+                print("[SDK Config Warning] msgspec is not installed; sending JSON instead of MessagePack")
+            wire_format = "json"
+        self.wire_format = wire_format
+        self._msgpack = wire_format == "msgpack"
+        self._batch_chunks = _msgpack_batch_chunks if self._msgpack else _json_batch_chunks
+
+        self._batch_supported = True  # Cleared if the server has no batch endpoint
+        # 10.2 Fail-Safe Behavior: a client that cannot be configured (e.g. a
+        # malformed port or an API key that cannot go in a header) must not
+        # raise into the host; it records nothing instead
+        self._disabled = False
+        try:
+            self._prepare_requests()
+        except Exception as e:
+            self._disabled = True
+            if debug:
+                print(f"[SDK Config Error] {e}; events from this client will be discarded")
+
+        self._dropped = 0  # Events this client's appends evicted from a full buffer
+        self._reported_drops = 0
+
+    def _prepare_requests(self):
+        """
+        Works out routing for this client's events and prebuilds its request
+        heads. Raises if the endpoint or credentials cannot be encoded.
+        """
+        # Routing for this client's events over the shared connections
+        url = urllib.parse.urlsplit(self.endpoint)
+        tls = url.scheme == "https"
+        proxy = _proxy_for(url.scheme, url.hostname)
+        self._connection_key = ((url.hostname, url.port or (443 if tls else 80)), tls, proxy)
+        self._path = url.path
+        self._batch_path = f"{url.path}:batch"
+        # Request headers never change for a client, so build them once
+        self._headers = {
+            "Content-Type": "application/msgpack" if self._msgpack else "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "User-Agent": "ProVit-SDK-Python/v0.1",
+            "Connection": "keep-alive"
+        }
+        # A plain-HTTP proxy is sent absolute-form request targets and the proxy
+        # credentials; through an https tunnel the platform sees normal requests
+        host = url.netloc.rpartition('@')[2]
+        target_prefix = ""
+        if proxy is not None and not tls:
+            target_prefix = f"http://{host}"
+            if proxy[1]:
+                self._headers["Proxy-Authorization"] = proxy[1]
+        # ...and render them, with the request line, into one %-template per path
+        # that only needs the Content-Length filled in; a request is then
+        # head + body, written in one sendall
+        header_lines = "".join(f"{name}: {value}\r\n" for name, value in self._headers.items())
+        self._heads = {
+            path: f"POST {target_prefix}{path} HTTP/1.1\r\nHost: {host}\r\n{header_lines}".encode('latin-1')
+                  .replace(b"%", b"%%") + b"Content-Length: %d\r\n\r\n"
+            for path in (self._path, self._batch_path)
+        }
+        self._head_room = len(self._heads[self._batch_path]) + 64
+
+    @classmethod
+    def _start_worker(cls):
+        """
+        Creates the shared buffer and worker thread the first time any client
+        emits an event, and returns the buffer.
+        """
+        with cls._lock:
+            if cls._shared_worker is not None:
+                return cls._shared_buf
+            # deque.append/popleft are atomic, so the hand-off needs no lock; the
+            # event only wakes the worker when it is idle
+            cls._shared_wake = threading.Event()
+            cls._shared_full = threading.Event()
+            # ai_runtime checks only the buffer without taking the lock, so it is
+            # published last, once everything it leads to exists
+            cls._shared_buf = collections.deque(maxlen=_MAX_BUFFERED_EVENTS)
+            cls._shared_worker = threading.Thread(
+                target=cls._worker_loop,
+                name="provit-sdk-worker",
+                daemon=True  # Ensure thread doesn't block program exit
+            )
+            cls._shared_worker.start()
+            if not cls._exit_hooked:
+                atexit.register(cls._shutdown_hook)
+                cls._exit_hooked = True
+            return cls._shared_buf
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """
+        Drops the parent's delivery state in a forked child. The worker thread
+        does not survive the fork, the parent still owns the buffered events and
+        the sockets, and a lock may have been held mid-fork; the child starts a
+        fresh worker on its first event.
+        """
+        cls._shared_buf = None
+        cls._shared_wake = None
+        cls._shared_full = None
+        cls._shared_worker = None
+        cls._sending = False
+        cls._drained = threading.Condition()
+        cls._connections = {}
+        cls._lock = threading.Lock()
 
     def ai_runtime(
         self, 
@@ -44,8 +503,8 @@ class ProVitClient:
         """
         Captures AI runtime recommendation evidence.
         
-        This method is strictly non-blocking. It spawns a background thread to 
-        send the data and returns immediately. All errors during transmission 
+        This method is strictly non-blocking. It buffers the event for the 
+        background worker and returns immediately. All errors during transmission 
         are suppressed to ensure the host AI application is never disrupted.
         
         Args:
@@ -53,71 +512,214 @@ class ProVitClient:
             model_name (str): Name of the model used.
             model_version (str): Version of the model.
             label (str): The output/recommendation (e.g., 'approve', 'fraud').
-            confidence_score (float): The model's confidence (0.0 - 1.0).
+            confidence_score (float): The model's confidence (0.0 - 1.0). NaN and
+                infinite scores are sent as null.
         """
+        if self._disabled:
+            return
         try:
             # 1. Normalize Label (if enabled)
-            processed_label = str(label)
-            if self.normalize_labels:
-                processed_label = processed_label.lower().strip()
-
-            # 2. Construct the canonical event structure
-            payload = {
-                "event_id": str(uuid.uuid4()),  # Unique ID for this specific evidence event
-                "event_type": "ai.runtime",
-                "decision_id": decision_id,
-                "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-                "meta": {
-                    "sdk_version": __version__,
-                    "language": "python",
-                    "python_version": platform.python_version()
-                },
-                "payload": {
-                    "model": {
-                        "name": model_name,
-                        "version": model_version
-                    },
-                    "recommendation": {
-                        "label": processed_label,
-                        "confidence_score": float(confidence_score)
-                    }
-                }
-            }
-
-            # Fire-and-forget: run network request in a daemon thread
-            thread = threading.Thread(target=self._send_event, args=(payload,))
-            thread.daemon = True  # Ensure thread doesn't block program exit
-            thread.start()
+            try:
+                processed_label = self._label_text(label)
+            except TypeError:  # Unhashable labels bypass the normalization cache
+                processed_label = str(label).lower().strip()
+
+            # NaN/Infinity are not JSON; they are sent as null on every wire
+            # format, whichever encoder is installed
+            score = float(confidence_score)
+            if not math.isfinite(score):
+                score = None
+
+            # 2. Render the canonical event structure straight to wire bytes;
+            #    for JSON, serialization is only needed to escape caller-supplied values
+            if not self._msgpack:
+                payload = _EVENT_TEMPLATE % (
+                    _fast_event_id(),  # Unique ID for this specific evidence event
+                    _dumps(decision_id),
+                    _iso_now(),
+                    _dumps(model_name),
+                    _dumps(model_version),
+                    _dumps(processed_label),
+                    _dumps(score)
+                )
+            else:
+                payload = _msgpack_encode(_RuntimeEvent(
+                    event_id=_fast_event_id().decode('ascii'),
+                    decision_id=decision_id,
+                    timestamp=_iso_now().decode('ascii'),
+                    payload=_Payload(
+                        _Model(model_name, model_version),
+                        _Recommendation(processed_label, score)
+                    )
+                ))
+
+            # Fire-and-forget: hand off to the background worker; a full
+            # buffer evicts its oldest event on append
+            buf = ProVitClient._shared_buf
+            if buf is None:
+                buf = ProVitClient._start_worker()
+            if len(buf) == buf.maxlen:
+                self._dropped += 1
+            buf.append((self, payload))
+            wake = ProVitClient._shared_wake
+            if not wake.is_set():
+                wake.set()
+            if len(buf) == _BATCH_SIZE:
+                ProVitClient._shared_full.set()
             
         except Exception as e:
             if self.debug:
                 print(f"[SDK Start Error] {e}")
 
-    def _send_event(self, event_data: dict):
+    async def ai_runtime_async(
+        self,
+        decision_id: str,
+        model_name: str,
+        model_version: str,
+        label: str,
+        confidence_score: float
+    ):
+        """
+        Coroutine form of ai_runtime() for asyncio hosts.
+        
+        Recording an event never waits on the network: the event is buffered
+        and the shared background worker sends it, so this completes without
+        yielding to the event loop and no task or connection is created per call.
+        Arguments are the same as for ai_runtime().
+        """
+        self.ai_runtime(decision_id, model_name, model_version, label, confidence_score)
+
+    @classmethod
+    def _worker_loop(cls):
         """
-        Internal method to send the event via HTTP POST.
-        Suppresses all exceptions.
+        Background consumer. Drains the shared buffer in batches for the 
+        lifetime of the process, sending each client's events together.
+        """
+        while True:
+            cls._shared_wake.wait()
+            cls._shared_wake.clear()
+            buf = cls._shared_buf
+            # Cleared before the size check, so a batch filling up after it
+            # still ends the wait
+            cls._shared_full.clear()
+            if len(buf) < _BATCH_SIZE:
+                # Let the rest of a burst arrive so it shares one POST
+                cls._shared_full.wait(_BATCH_LINGER)
+
+            while buf:
+                with cls._drained:
+                    cls._sending = True  # Set before popping so a flush never sees a gap
+                try:
+                    by_client = {}
+                    for _ in range(min(len(buf), _BATCH_SIZE)):
+                        client, payload = buf.popleft()
+                        by_client.setdefault(client, []).append(payload)
+                    for client, batch in by_client.items():
+                        client._report_drops()
+                        client._send_batch(batch)
+                finally:
+                    with cls._drained:
+                        cls._sending = False
+                        cls._drained.notify_all()
+
+    @classmethod
+    def _shutdown_hook(cls):
+        """
+        Registered with atexit. Gives buffered events a bounded amount of time 
+        to be delivered so exiting never hangs on an unreachable server.
+        """
+        cls._join_with_timeout(_SHUTDOWN_TIMEOUT)
+
+    @classmethod
+    def _join_with_timeout(cls, timeout: float) -> bool:
+        """
+        Waits until the buffer is empty and no batch is in flight, or until
+        timeout seconds pass. Returns True if everything was flushed.
+        """
+        end = time.monotonic() + timeout
+        with cls._drained:
+            while cls._shared_buf or cls._sending:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                cls._drained.wait(remaining)
+        return True
+
+    def _report_drops(self):
+        """In debug mode, prints how many events this client has had evicted."""
+        if self.debug and self._dropped != self._reported_drops:
+            self._reported_drops = self._dropped
+            print(f"[SDK Buffer Full] {self._reported_drops} oldest events dropped so far")
+
+    def _send_batch(self, batch: list):
+        """
+        Sends a list of events as a single POST to the batch endpoint,
+        falling back to one POST per event if the server does not offer it.
+        """
+        if self._batch_supported:
+            status = self._post(self._batch_path, self._batch_chunks(batch))
+            if status != 404:
+                return
+            self._batch_supported = False
+
+        for event_data in batch:
+            self._post(self._path, (event_data,))
+
+    def _post(self, path: str, chunks) -> Optional[int]:
+        """
+        Assembles a request in the reusable scratch buffer and sends it. The
+        body chunks are written after a reserved gap and the head is then
+        placed right before them, so the whole request goes out as one
+        contiguous slice without being concatenated.
+        """
+        scratch = ProVitClient._scratch
+        body_start = self._head_room
+        if len(scratch) < body_start:
+            # A long API key or URL can need a gap wider than the buffer; slice
+            # assignment past the end would append instead of writing at body_start
+            scratch.extend(bytes(body_start - len(scratch)))
+        end = self._write_chunks(scratch, chunks, body_start)
+        head = self._request_head(path, end - body_start)
+        start = body_start - len(head)
+        scratch[start:body_start] = head
+        with memoryview(scratch) as view:
+            return self._send_request(path, view[start:end])
+
+    @staticmethod
+    def _write_chunks(scratch: bytearray, chunks, pos: int) -> int:
+        """
+        Copies the chunks into the scratch buffer starting at pos and returns
+        the end offset. The buffer only ever grows, so steady-state requests
+        are assembled without allocating.
+        """
+        for chunk in chunks:
+            end = pos + len(chunk)
+            scratch[pos:end] = chunk
+            pos = end
+        return pos
+
+    def _request_head(self, path: str, content_length: int) -> bytes:
+        """Request line and headers for a POST to path with a body of the given size."""
+        return self._heads[path] % content_length
+
+    def _send_request(self, path: str, request) -> Optional[int]:
+        """
+        Internal method to send one framed HTTP request over the shared
+        keep-alive connection for this client's host.
+        Suppresses all exceptions; returns the HTTP status, or None on failure.
         """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "ProVit-SDK-Python/v0.1"
-            }
-            
-            data = json.dumps(event_data).encode('utf-8')
-            req = urllib.request.Request(
-                self.endpoint, 
-                data=data, 
-                headers=headers, 
-                method='POST'
-            )
+            conn = ProVitClient._connections.get(self._connection_key)
+            if conn is None:
+                conn = ProVitClient._connections[self._connection_key] = _Connection(*self._connection_key)
 
-            # Strict 2-second timeout as per specification
-            with urllib.request.urlopen(req, timeout=2) as response:
-                # Read response to ensure connection closes cleanly, 
-                # but ignore content
-                response.read()
+            status, reason = conn.request(request)
+
+            # A 404 from the batch endpoint only means "fall back", not an error
+            not_found_batch = status == 404 and path == self._batch_path
+            if status >= 400 and self.debug and not not_found_batch:
+                print(f"[SDK Transmission Error] HTTP Error {status}: {reason}")
+            return status
 
         except Exception as e:
             # 10.2 Fail-Safe Behavior:
@@ -125,3 +727,9 @@ class ProVitClient:
             # "If ProVit is unreachable, the AI continues normally."
             if self.debug:
                 print(f"[SDK Transmission Error] {e}")
+            return None
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not resend its parent's buffered events
+    os.register_at_fork(after_in_child=ProVitClient._reset_after_fork)
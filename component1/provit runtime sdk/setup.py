@@ -21,6 +21,10 @@ setup(
     packages=find_packages(), 
     py_modules=["provit_sdk"],
     install_requires=[],
+    extras_require={
+        "fast": ["orjson"],  # Optional faster JSON encoding
+        "msgpack": ["msgspec"],  # Optional MessagePack wire format
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -1,13 +1,38 @@
 
+import functools
 import joblib
-import pandas as pd
 import numpy as np
 import os
 import uuid
 import datetime
+import warnings
 
 MODEL_PATH = "loan_risk_model.pkl"
 
+# Feature columns in training order
+FEATURES = ['annual_income', 'fico_score', 'dti_ratio', 'loan_amount']
+
+# Reported model identity per estimator type, so evidence names the model
+# that the loaded artifact actually contains
+MODEL_NAMES = {
+    'RandomForestClassifier': "random_forest_credit_risk",
+    'HistGradientBoostingClassifier': "hist_gradient_boosting_credit_risk",
+}
+
+@functools.lru_cache(maxsize=4)
+def _load_model(path: str, mtime: float):
+    """
+    Unpickles a model artifact once per process and returns (estimator,
+    feature order). Engines share the fitted estimator (read-only at predict
+    time); mtime is part of the key so a retrained artifact is picked up.
+    """
+    print(f"[CreditEngine] Loading Model v1.0 from {path}...")
+    artifact = joblib.load(path)
+    if isinstance(artifact, dict):
+        return artifact["model"], list(artifact["features"])
+    # Older artifacts are a bare estimator fit on a DataFrame, which records its columns
+    return artifact, list(getattr(artifact, "feature_names_in_", FEATURES))
+
 class CreditScoringEngine:
     """
     Production-grade inference engine for evaluating credit risk.
@@ -19,10 +44,15 @@ class CreditScoringEngine:
         if not os.path.exists(self.model_path):
             raise FileNotFoundError(f"Model artifact '{self.model_path}' missing. Please train model first.")
         
-        print(f"[CreditEngine] Loading Model v1.0 from {self.model_path}...")
-        self.model = joblib.load(self.model_path)
+        self.model, trained_on = _load_model(os.path.abspath(self.model_path), os.path.getmtime(self.model_path))
         self.model_version = "v1.0.0" # Hardcoded for now, should come from metadata
-        self.model_name = "random_forest_credit_risk"
+        self.model_name = MODEL_NAMES.get(type(self.model).__name__, "credit_risk")
+
+        # Applicants are scored as bare arrays, which carry no column names, so
+        # check once that the artifact expects the FEATURES order
+        if trained_on != FEATURES:
+            raise ValueError(f"Model expects features {trained_on}, engine provides {FEATURES}")
+        self._fit_on_dataframe = hasattr(self.model, "feature_names_in_")
 
     def evaluate_applicant(self, applicant_id: str, income: float, fico: int, dti: float, amount: float):
         """
@@ -31,18 +61,53 @@ class CreditScoringEngine:
         """
         print(f"\n[CreditEngine] Evaluating Applicant {applicant_id}...")
     
-        # Construct DataFrame (must match training schema exactly)
-        input_data = pd.DataFrame([{
-            'annual_income': income,
-            'fico_score': fico,
-            'dti_ratio': dti,
-            'loan_amount': amount
-        }])
+        # One float32 row in FEATURES order; the trees compare in float32 anyway,
+        # and a plain array skips the per-call DataFrame construction
+        input_data = np.array([[income, fico, dti, amount]], dtype=np.float32)
         
-        # 1. Inference
-        prob_default = self.model.predict_proba(input_data)[0][1]
-        prediction = self.model.predict(input_data)[0]
+        # 1. Inference (predict() is just the argmax of predict_proba(), so one
+        #    pass over the forest gives both)
+        proba = self._predict_proba(input_data)[0]
+        prediction = self.model.classes_[proba.argmax()]
         
+        return self._build_result(applicant_id, proba[1], prediction)
+
+    def evaluate_batch(self, applicants):
+        """
+        Evaluates many loan applications with a single model call.
+        applicants: iterable of (applicant_id, income, fico, dti, amount) tuples.
+        Returns: list of result dicts, in input order (see evaluate_applicant)
+        """
+        applicants = list(applicants)
+        print(f"\n[CreditEngine] Evaluating {len(applicants)} Applicants...")
+        if not applicants:
+            return []
+
+        # Same input as evaluate_applicant: float32 rows in FEATURES order
+        input_data = np.array([row[1:] for row in applicants], dtype=np.float32)
+        
+        # One inference pass for the whole batch; predictions come from the same probabilities
+        proba = self._predict_proba(input_data)
+        predictions = self.model.classes_[proba.argmax(axis=1)]
+        
+        results = []
+        for row, prob_default, prediction in zip(applicants, proba[:, 1], predictions):
+            print(f"  [{row[0]}]")
+            results.append(self._build_result(row[0], prob_default, prediction))
+        return results
+
+    def _predict_proba(self, input_data):
+        """predict_proba() on a float32 array whose columns are in FEATURES order."""
+        if not self._fit_on_dataframe:
+            return self.model.predict_proba(input_data)
+        # Older artifacts warn that the array has no column names. The order was
+        # checked at load time, so silence just that warning for just this call
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+            return self.model.predict_proba(input_data)
+
+    def _build_result(self, applicant_id: str, prob_default: float, prediction):
+        """Applies the business rules to one model output and logs it."""
         # 2. Business Logic Wrapper
         decision = "REJECTED" if prediction == 1 else "APPROVED"
         risk_level = "High" if prob_default > 0.5 else "Low"
@@ -70,5 +135,11 @@ if __name__ == "__main__":
         ("app-003-Charlie",65000, 670, 0.42, 30000)  # Borderline
     ]
 
-    for app_id, inc, fico, dti, amt in scenarios:
-        result = engine.evaluate_applicant(app_id, inc, fico, dti, amt)
+    results = engine.evaluate_batch(scenarios)
+
+    # Batch and single-row scoring must agree exactly
+    for row, batch_result in zip(scenarios, results):
+        single_result = engine.evaluate_applicant(*row)
+        assert single_result["decision"] == batch_result["decision"], row[0]
+        assert single_result["confidence_score"] == batch_result["confidence_score"], row[0]
+    print("\n[CreditEngine] Batch and single-applicant scoring agree")